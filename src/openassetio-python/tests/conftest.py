@@ -71,19 +71,25 @@ def unload_openassetio_modules():
         sys.modules[name] = module
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_logger():
     """
     Fixture providing a mock that conforms to the LoggerInterface.
+
+    Module-scoped to avoid re-autospeccing the interface for every test.
+    State is restored between tests by `reset_shared_mock_fixtures`.
     """
     return MockLogger()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_host_interface():
     """
     Fixture for a `HostInterface` that forwards method calls to an
     internal public `mock.Mock` instance.
+
+    Module-scoped to avoid re-autospeccing the interface for every test.
+    State is restored between tests by `reset_shared_mock_fixtures`.
     """
     return MockHostInterface()
 
@@ -114,16 +120,34 @@ def mock_entity_reference_pager_interface():
     return MockEntityReferencePagerInterface()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_manager_interface(create_mock_manager_interface):
     """
     Fixture for a `ManagerInterface` that asserts parameter types and
     forwards method calls to an internal public `mock.Mock` instance.
+
+    Session-scoped so the (large) interface is autospec'd once per test
+    run rather than once per test. State is restored between tests by
+    `reset_shared_mock_fixtures`.
     """
     return create_mock_manager_interface()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_shared_mock_fixtures(mock_logger, mock_host_interface, mock_manager_interface):
+    """
+    Restores the shared mock fixtures to their default state before each
+    test, so that widening their scope does not leak recorded calls or
+    configured return values between tests.
+    """
+    mock_logger.mock.reset_mock(return_value=True, side_effect=True)
+    mock_host_interface.mock.reset_mock(return_value=True, side_effect=True)
+    mock_manager_interface.mock.reset_mock(return_value=True, side_effect=True)
+    # Re-apply defaults configured by `create_mock_manager_interface`.
+    mock_manager_interface.mock.info.return_value = {}
+
+
+@pytest.fixture(scope="session")
 def create_mock_manager_interface():
     """
     Fixture providing a factory function for creating new
@@ -50,6 +50,8 @@ from openassetio.trait import TraitsData
 # __str__ and __repr__ aren't tested as they're debug tricks that need
 # assessing when this is ported to cpp
 
+kRefPrefixInfoKey = constants.kInfoKey_EntityReferencesMatchPrefix
+
 
 class Test_Manager_init:
     def test_when_constructed_with_ManagerInterface_as_None_then_raises_TypeError(
@@ -215,7 +217,7 @@ class Test_Manager_initialize:
         self, manager, mock_manager_interface, mock_logger
     ):
         mock_manager_interface.mock.info.return_value = {
-            constants.kInfoKey_EntityReferencesMatchPrefix: "someprefix:"
+            kRefPrefixInfoKey: "someprefix:"
         }
 
         manager.initialize({})
@@ -231,7 +233,7 @@ class Test_Manager_initialize:
         self, manager, mock_manager_interface, mock_logger
     ):
         mock_manager_interface.mock.info.return_value = {
-            constants.kInfoKey_EntityReferencesMatchPrefix: 123
+            kRefPrefixInfoKey: 123
         }
 
         manager.initialize({})
@@ -390,7 +392,7 @@ class Test_Manager_isEntityReferenceString:
         self, manager, mock_manager_interface, prefix, entity_ref, expected
     ):
         mock_manager_interface.mock.info.return_value = {
-            constants.kInfoKey_EntityReferencesMatchPrefix: prefix
+            kRefPrefixInfoKey: prefix
         }
         manager.initialize({})
 
@@ -426,108 +426,94 @@ class Test_ManagerFactory_defaultManagerForInterface:
 
 
 class Test_ManagerFactory_createManager:
-    def test_returns_a_manager(self, a_manager_factory):
-        manager = a_manager_factory.createManager("a.manager")
-        assert isinstance(manager, Manager)
-
-    def test_manager_is_properly_configured(
-        self, assert_expected_manager, a_manager_factory, mock_manager_implementation_factory
-    ):
-        # setup
-
-        expected_identifier = "a.manager"
-
-        # action
-
-        manager = a_manager_factory.createManager(expected_identifier)
-
-        # confirm
-
-        assert isinstance(manager, Manager)
-        mock_manager_implementation_factory.mock.instantiate.assert_called_once_with(
-            expected_identifier
-        )
-        assert_expected_manager(manager)
+    # Covers both the createManager instance method and the
+    # createManagerForInterface static convenience, via the parametrized
+    # a_created_manager fixture.
 
-
-class Test_ManagerFactory_createManagerForInterface:
-    def test_returns_a_manager(
-        self, mock_manager_implementation_factory, mock_host_interface, mock_logger
-    ):
-        manager = ManagerFactory.createManagerForInterface(
-            "a.manager", mock_host_interface, mock_manager_implementation_factory, mock_logger
-        )
-
-        assert isinstance(manager, Manager)
+    def test_returns_a_manager(self, a_created_manager):
+        # The factory always constructs a Manager exactly, never a
+        # subclass, so compare types directly.
+        assert type(a_created_manager) is Manager
 
     def test_manager_is_properly_configured(
-        self,
-        assert_expected_manager,
-        mock_manager_implementation_factory,
-        mock_host_interface,
-        mock_logger,
+        self, a_created_manager, mock_manager_interface, mock_manager_implementation_factory
     ):
-        # setup
-
-        expected_identifier = "a.manager"
-
-        # action
-
-        manager = ManagerFactory.createManagerForInterface(
-            expected_identifier,
-            mock_host_interface,
-            mock_manager_implementation_factory,
-            mock_logger,
-        )
-
-        # confirm
-
-        mock_manager_implementation_factory.mock.instantiate.assert_called_once_with(
-            expected_identifier
-        )
-        assert_expected_manager(manager)
+        expected_settings = {"some": "settings"}
+        mock_manager_interface.mock.settings.return_value = expected_settings
 
+        mock_manager_implementation_factory.mock.instantiate.assert_called_once_with("a.manager")
+        assert a_created_manager.settings() == expected_settings
 
-@pytest.fixture
-def assert_expected_manager(mock_host_interface, mock_manager_interface):
-    # Assert the expected manager is constructed and is given the
-    # expected host session in method calls (`settings()` abused
-    # here for this purpose).
-    def assert_for_manager(manager):
+    def test_host_session_exposes_host_interface_identifier(
+        self, a_created_manager, mock_host_interface, mock_manager_interface
+    ):
         expected_host_identifier = "a.host"
-        expected_settings = {"some": "settings"}
-
         mock_host_interface.mock.identifier.return_value = expected_host_identifier
 
+        # The host session is constructed privately by the factory, so
+        # use a side-effect to check it when the manager calls through
+        # (`settings()` abused here for this purpose).
         def assert_expected_host(hostSession):
             assert hostSession.host().identifier() == expected_host_identifier
             return mock.DEFAULT
 
         mock_manager_interface.mock.settings.side_effect = assert_expected_host
-        mock_manager_interface.mock.settings.return_value = expected_settings
-
-        assert manager.settings() == expected_settings
-
-    return assert_for_manager
+        mock_manager_interface.mock.settings.return_value = {}
+
+        a_created_manager.settings()
+
+        mock_manager_interface.mock.settings.assert_called_once()
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(False, id="createManager"),
+        pytest.param(True, id="createManagerForInterface"),
+    ]
+)
+def a_created_manager(
+    request,
+    a_manager_factory,
+    mock_host_interface,
+    mock_manager_implementation_factory,
+    mock_logger,
+):
+    if request.param:
+        return ManagerFactory.createManagerForInterface(
+            "a.manager", mock_host_interface, mock_manager_implementation_factory, mock_logger
+        )
+    return a_manager_factory.createManager("a.manager")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def a_manager_factory(mock_host_interface, mock_manager_implementation_factory, mock_logger):
+    # Module-scoped since the factory holds no mutable state of its own.
     return ManagerFactory(mock_host_interface, mock_manager_implementation_factory, mock_logger)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def a_cpp_manager_factory(mock_host_interface, mock_manager_implementation_factory, mock_logger):
+    # Module-scoped since the factory holds no mutable state of its own.
     return CppManagerFactory(mock_host_interface, mock_manager_implementation_factory, mock_logger)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_manager_implementation_factory(mock_logger, mock_manager_interface):
+    # Module-scoped to avoid rebuilding the mock for every test. State
+    # is restored between tests by `reset_mock_manager_implementation_factory`.
     factory = MockManagerImplementationFactory(mock_logger)
     factory.mock.instantiate.return_value = mock_manager_interface
     return factory
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_manager_implementation_factory(
+    mock_manager_implementation_factory, mock_manager_interface
+):
+    mock_manager_implementation_factory.mock.reset_mock(return_value=True, side_effect=True)
+    mock_manager_implementation_factory.mock.instantiate.return_value = mock_manager_interface
+
+
 @pytest.fixture
 def resources_dir():
     test_dir = os.path.dirname(__file__)
@@ -608,9 +594,10 @@ class MockManagerImplementationFactory(ManagerImplementationFactoryInterface):
 
     def __init__(self, logger):
         ManagerImplementationFactoryInterface.__init__(self, logger)
-        self.mock = mock.create_autospec(
-            ManagerImplementationFactoryInterface, spec_set=True, instance=True
-        )
+        # An explicit spec_set of the two methods exercised by these
+        # tests avoids introspecting the interface class entirely,
+        # whilst still rejecting access to misspelt attributes.
+        self.mock = mock.Mock(spec_set=["identifiers", "instantiate"])
 
     def identifiers(self):
         return self.mock.identifiers()
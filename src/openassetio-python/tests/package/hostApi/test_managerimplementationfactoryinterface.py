@@ -37,27 +37,22 @@ class Test_ManagerImplementationFactoryInterface:
             a_manager_interface_factory_interface._logger = "something"
 
 
-class Test_ManagerImplementationFactoryInterface_identifiers:
+class Test_ManagerImplementationFactoryInterface_pure_virtual_methods:
+    @pytest.mark.parametrize(
+        "method_name, args",
+        [
+            pytest.param("identifiers", (), id="identifiers"),
+            pytest.param("instantiate", ("a.manager.identifier",), id="instantiate"),
+        ],
+    )
     def test_when_not_overridden_then_raises_exception(
-        self, a_manager_interface_factory_interface
+        self, a_manager_interface_factory_interface, method_name, args
     ):
         with pytest.raises(RuntimeError) as err:
-            a_manager_interface_factory_interface.identifiers()
+            getattr(a_manager_interface_factory_interface, method_name)(*args)
         assert (
             str(err.value) == "Tried to call pure virtual function"
-            ' "ManagerImplementationFactoryInterface::identifiers"'
-        )
-
-
-class Test_ManagerImplementationFactoryInterface_instantiate:
-    def test_when_not_overridden_then_raises_exception(
-        self, a_manager_interface_factory_interface
-    ):
-        with pytest.raises(RuntimeError) as err:
-            a_manager_interface_factory_interface.instantiate("a.manager.identifier")
-        assert (
-            str(err.value) == "Tried to call pure virtual function"
-            ' "ManagerImplementationFactoryInterface::instantiate"'
+            f' "ManagerImplementationFactoryInterface::{method_name}"'
         )
 
 
@@ -34,27 +34,18 @@ class Test_HostSession_inheritance:
 
 
 class Test_HostSession_init:
-    def test_when_host_is_None_then_raises_TypeError(self, mock_logger):
+    @pytest.mark.parametrize(
+        "invalid_args",
+        [
+            pytest.param(lambda host, logger: (None, logger), id="null_host"),
+            pytest.param(lambda host, logger: (object(), logger), id="invalid_host"),
+            pytest.param(lambda host, logger: (host, None), id="null_logger"),
+            pytest.param(lambda host, logger: (host, object()), id="invalid_logger"),
+        ],
+    )
+    def test_when_arg_is_invalid_then_raises_TypeError(self, invalid_args, a_host, mock_logger):
         with pytest.raises(TypeError) as err:
-            HostSession(None, mock_logger)
-
-        assert str(err.value).startswith("__init__(): incompatible constructor arguments")
-
-    def test_when_invalid_host_then_raises_TypeError(self, mock_logger):
-        with pytest.raises(TypeError) as err:
-            HostSession(object(), mock_logger)
-
-        assert str(err.value).startswith("__init__(): incompatible constructor arguments")
-
-    def test_when_logger_is_None_then_raises_TypeError(self, a_host):
-        with pytest.raises(TypeError) as err:
-            HostSession(a_host, None)
-
-        assert str(err.value).startswith("__init__(): incompatible constructor arguments")
-
-    def test_when_invalid_logger_then_raises_TypeError(self, a_host):
-        with pytest.raises(TypeError) as err:
-            HostSession(a_host, object())
+            HostSession(*invalid_args(a_host, mock_logger))
 
         assert str(err.value).startswith("__init__(): incompatible constructor arguments")
 
@@ -104,19 +104,24 @@ class Test_TraitsData_hasTrait:
 
 
 class Test_TraitsData_getsetTraitProperty:
-    def test_valid_values(self, a_traitsdata):
-        a_traitsdata.setTraitProperty("first_trait", "a string", "string")
-        a_traitsdata.setTraitProperty("second_trait", "an int", 1)
-        a_traitsdata.setTraitProperty("first_trait", "a float", 1.0)
-        a_traitsdata.setTraitProperty("second_trait", "a bool", True)
-
-        assert a_traitsdata.getTraitProperty("first_trait", "a string") == "string"
-        assert isinstance(a_traitsdata.getTraitProperty("first_trait", "a string"), str)
-        assert a_traitsdata.getTraitProperty("second_trait", "an int") == 1
-        assert isinstance(a_traitsdata.getTraitProperty("second_trait", "an int"), int)
-        assert a_traitsdata.getTraitProperty("first_trait", "a float") == 1.0
-        assert isinstance(a_traitsdata.getTraitProperty("first_trait", "a float"), float)
-        assert a_traitsdata.getTraitProperty("second_trait", "a bool") is True
+    @pytest.mark.parametrize(
+        "populated_traitsdata",
+        [
+            [
+                ("first_trait", "a string", "string"),
+                ("second_trait", "an int", 1),
+                ("first_trait", "a float", 1.0),
+                ("second_trait", "a bool", True),
+            ]
+        ],
+        indirect=True,
+    )
+    def test_valid_values_round_trip(self, populated_traitsdata):
+        data, properties = populated_traitsdata
+        for trait_id, property_key, expected_value in properties:
+            actual_value = data.getTraitProperty(trait_id, property_key)
+            assert actual_value == expected_value
+            assert isinstance(actual_value, type(expected_value))
 
     def test_when_key_is_not_found_then_get_returns_None(self, a_traitsdata):
         assert a_traitsdata.getTraitProperty("first_trait", "a string") is None
@@ -186,3 +191,12 @@ class Test_TraitsData_equality:
 @pytest.fixture
 def a_traitsdata():
     return TraitsData({"first_trait", "second_trait"})
+
+
+@pytest.fixture
+def populated_traitsdata(request, a_traitsdata):
+    # Indirectly parametrized with a list of (trait id, property key,
+    # value) tuples to set on the data.
+    for trait_id, property_key, value in request.param:
+        a_traitsdata.setTraitProperty(trait_id, property_key, value)
+    return a_traitsdata, request.param